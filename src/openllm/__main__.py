@@ -6,7 +6,6 @@ import sys
 from collections import defaultdict
 from typing import Annotated, Optional
 
-import questionary
 import typer
 
 from openllm.accelerator_spec import DeploymentTarget, can_run, get_local_machine_spec
@@ -33,9 +32,9 @@ app.add_typer(clean_app, name='clean')
 
 
 def _select_bento_name(models: list[BentoInfo], target: DeploymentTarget):
+    import questionary
     from tabulate import tabulate
 
-    options = []
     model_infos = [(model.repo.name, model.name, can_run(model, target)) for model in models]
     model_name_groups = defaultdict(lambda: 0.0)
     for repo, name, score in model_infos:
@@ -47,9 +46,8 @@ def _select_bento_name(models: list[BentoInfo], target: DeploymentTarget):
     table = tabulate(table_data, headers=['model', 'repo', 'locally runnable']).split('\n')
     headers = f'{table[0]}\n   {table[1]}'
 
-    options.append(questionary.Separator(headers))
-    for table_data, table_line in zip(table_data, table[2:]):
-        options.append(questionary.Choice(table_line, value=table_data[:2]))
+    options = [questionary.Separator(headers)]
+    options.extend(questionary.Choice(line, value=row[:2]) for row, line in zip(table_data, table[2:]))
     selected = questionary.select('Select a model', options).ask()
     if selected is None:
         raise typer.Exit(1)
@@ -57,26 +55,21 @@ def _select_bento_name(models: list[BentoInfo], target: DeploymentTarget):
 
 
 def _select_bento_version(models, target, bento_name, repo):
+    import questionary
     from tabulate import tabulate
 
     model_infos = [
         [model, can_run(model, target)] for model in models if model.name == bento_name and model.repo.name == repo
     ]
 
-    table_data = [
-        [model.tag, CHECKED if score > 0 else '']
-        for model, score in model_infos
-        if model.name == bento_name and model.repo.name == repo
-    ]
+    table_data = [[model.tag, CHECKED if score > 0 else ''] for model, score in model_infos]
     if not table_data:
         output(f'No model found for {bento_name} in {repo}', style='red')
         raise typer.Exit(1)
     table = tabulate(table_data, headers=['version', 'locally runnable']).split('\n')
 
-    options = []
-    options.append(questionary.Separator(f'{table[0]}\n   {table[1]}'))
-    for table_data, table_line in zip(model_infos, table[2:]):
-        options.append(questionary.Choice(table_line, value=table_data))
+    options = [questionary.Separator(f'{table[0]}\n   {table[1]}')]
+    options.extend(questionary.Choice(line, value=info) for info, line in zip(model_infos, table[2:]))
     selected = questionary.select('Select a version', options).ask()
     if selected is None:
         raise typer.Exit(1)
@@ -84,9 +77,9 @@ def _select_bento_version(models, target, bento_name, repo):
 
 
 def _select_target(bento, targets):
+    import questionary
     from tabulate import tabulate
 
-    options = []
     targets.sort(key=lambda x: can_run(bento, x), reverse=True)
     if not targets:
         output('No available instance type, check your bentocloud account', style='red')
@@ -104,10 +97,8 @@ def _select_target(bento, targets):
         ],
         headers=['instance type', 'accelerator', 'price/hr', 'deployable'],
     ).split('\n')
-    options.append(questionary.Separator(f'{table[0]}\n   {table[1]}'))
-
-    for target, line in zip(targets, table[2:]):
-        options.append(questionary.Choice(f'{line}', value=target))
+    options = [questionary.Separator(f'{table[0]}\n   {table[1]}')]
+    options.extend(questionary.Choice(line, value=target) for target, line in zip(targets, table[2:]))
     selected = questionary.select('Select an instance type', options).ask()
     if selected is None:
         raise typer.Exit(1)
@@ -115,41 +106,24 @@ def _select_target(bento, targets):
 
 
 def _select_action(bento: BentoInfo, score):
-    if score > 0:
-        options = [
-            questionary.Separator('Available actions'),
-            questionary.Choice('0. Run the model in terminal', value='run', shortcut_key='0'),
-            questionary.Separator(f'  $ openllm run {bento}'),
-            questionary.Separator(' '),
-            questionary.Choice('1. Serve the model locally and get a chat server', value='serve', shortcut_key='1'),
-            questionary.Separator(f'  $ openllm serve {bento}'),
-            questionary.Separator(' '),
-            questionary.Choice(
-                '2. Deploy the model to bentocloud and get a scalable chat server', value='deploy', shortcut_key='2'
-            ),
-            questionary.Separator(f'  $ openllm deploy {bento}'),
-        ]
-    else:
-        options = [
-            questionary.Separator('Available actions'),
-            questionary.Choice(
-                '0. Run the model in terminal', value='run', disabled='insufficient res.', shortcut_key='0'
-            ),
-            questionary.Separator(f'  $ openllm run {bento}'),
-            questionary.Separator(' '),
-            questionary.Choice(
-                '1. Serve the model locally and get a chat server',
-                value='serve',
-                disabled='insufficient res.',
-                shortcut_key='1',
-            ),
-            questionary.Separator(f'  $ openllm serve {bento}'),
-            questionary.Separator(' '),
-            questionary.Choice(
-                '2. Deploy the model to bentocloud and get a scalable chat server', value='deploy', shortcut_key='2'
-            ),
-            questionary.Separator(f'  $ openllm deploy {bento}'),
-        ]
+    import questionary
+
+    disabled = None if score > 0 else 'insufficient res.'
+    options = [
+        questionary.Separator('Available actions'),
+        questionary.Choice('0. Run the model in terminal', value='run', disabled=disabled, shortcut_key='0'),
+        questionary.Separator(f'  $ openllm run {bento}'),
+        questionary.Separator(' '),
+        questionary.Choice(
+            '1. Serve the model locally and get a chat server', value='serve', disabled=disabled, shortcut_key='1'
+        ),
+        questionary.Separator(f'  $ openllm serve {bento}'),
+        questionary.Separator(' '),
+        questionary.Choice(
+            '2. Deploy the model to bentocloud and get a scalable chat server', value='deploy', shortcut_key='2'
+        ),
+        questionary.Separator(f'  $ openllm deploy {bento}'),
+    ]
     action = questionary.select('Select an action', options).ask()
     if action is None:
         raise typer.Exit(1)
@@ -123,10 +123,7 @@ def can_run(bento: typing.Union[Resource, BentoInfo], target: typing.Optional[De
         target = get_local_machine_spec()
 
     resource_spec = Resource(**(bento.bento_yaml['services'][0]['config'].get('resources', {})))
-    labels = bento.bento_yaml.get('labels', {})
-    platforms = labels.get('platforms', 'linux').split(',')
-
-    if target.platform not in platforms:
+    if target.platform not in bento.platforms:
         return 0.0
 
     # return 1.0 if no resource is specified
@@ -14,12 +14,14 @@ import typer.core
 
 DO_NOT_TRACK = 'BENTOML_DO_NOT_TRACK'
 
+CAMEL_CASE_BOUNDARY_RE = re.compile(r'(?<!^)(?=[A-Z])')
+
 
 class EventMeta(ABC):
     @property
     def event_name(self):
         # camel case to snake case
-        event_name = re.sub(r'(?<!^)(?=[A-Z])', '_', self.__class__.__name__).lower()
+        event_name = CAMEL_CASE_BOUNDARY_RE.sub('_', self.__class__.__name__).lower()
         # remove "_event" suffix
         suffix_to_remove = '_event'
         if event_name.endswith(suffix_to_remove):
@@ -71,8 +73,6 @@ class OpenLLMTyper(typer.Typer):
                 @functools.wraps(f)
                 @click.pass_context
                 def wrapped(ctx: click.Context, *args, **kwargs):
-                    from bentoml._internal.utils.analytics import track
-
                     do_not_track = os.environ.get(DO_NOT_TRACK, str(False)).lower() == 'true'
 
                     # so we know that the root program is openllm
@@ -86,6 +86,9 @@ class OpenLLMTyper(typer.Typer):
 
                     if do_not_track:
                         return f(*args, **kwargs)
+
+                    from bentoml._internal.utils.analytics import track
+
                     start_time = time.time_ns()
                     try:
                         return_value = f(*args, **kwargs)
@@ -1,9 +1,8 @@
+import functools
 import os
 import pathlib
 import shutil
 
-import questionary
-
 from openllm.analytic import OpenLLMTyper
 from openllm.common import CONFIG_FILE, REPO_DIR, VENV_DIR, VERBOSE_LEVEL, output
 
@@ -15,22 +14,42 @@ HUGGINGFACE_CACHE = pathlib.Path.home() / '.cache' / 'huggingface' / 'hub'
 def _du(path: pathlib.Path) -> int:
     seen_paths = set()
     used_space = 0
-
-    for f in path.rglob('*'):
-        if os.name == 'nt':  # Windows system
-            # On Windows, directly add file sizes without considering hard links
-            used_space += f.stat().st_size
-        else:
-            # On non-Windows systems, use inodes to avoid double counting
-            stat = f.stat()
-            if stat.st_ino not in seen_paths:
-                seen_paths.add(stat.st_ino)
-                used_space += stat.st_size
+    # On Windows, directly add file sizes without considering hard links
+    is_windows = os.name == 'nt'
+
+    if not path.is_dir():
+        return used_space
+
+    dirs = [path]
+    while dirs:
+        with os.scandir(dirs.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.path)
+                stat = entry.stat()
+                if is_windows:
+                    used_space += stat.st_size
+                elif stat.st_ino not in seen_paths:
+                    # On non-Windows systems, use inodes to avoid double counting
+                    seen_paths.add(stat.st_ino)
+                    used_space += stat.st_size
     return used_space
 
 
+def _rmtree(path: pathlib.Path, jobs: int = 1) -> None:
+    # remove the top level entries concurrently, the rest is left to the final rmtree
+    if jobs > 1 and path.is_dir():
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            list(executor.map(functools.partial(shutil.rmtree, ignore_errors=True), path.iterdir()))
+    shutil.rmtree(path, ignore_errors=True)
+
+
 @app.command(help='Clean up all the cached models from huggingface')
-def model_cache(verbose: bool = False):
+def model_cache(verbose: bool = False, jobs: int = 1):
+    import questionary
+
     if verbose:
         VERBOSE_LEVEL.set(20)
     used_space = _du(HUGGINGFACE_CACHE)
@@ -39,12 +58,14 @@ def model_cache(verbose: bool = False):
     ).ask()
     if not sure:
         return
-    shutil.rmtree(HUGGINGFACE_CACHE, ignore_errors=True)
+    _rmtree(HUGGINGFACE_CACHE, jobs=jobs)
     output('All models cached by Huggingface have been removed', style='green')
 
 
 @app.command(help='Clean up all the virtual environments created by OpenLLM')
-def venvs(verbose: bool = False):
+def venvs(verbose: bool = False, jobs: int = 1):
+    import questionary
+
     if verbose:
         VERBOSE_LEVEL.set(20)
 
@@ -54,7 +75,7 @@ def venvs(verbose: bool = False):
     ).ask()
     if not sure:
         return
-    shutil.rmtree(VENV_DIR, ignore_errors=True)
+    _rmtree(VENV_DIR, jobs=jobs)
     output('All virtual environments have been removed', style='green')
 
 
@@ -75,10 +96,10 @@ def configs(verbose: bool = False):
 
 
 @app.command(name='all', help='Clean up all above and bring OpenLLM to a fresh start')
-def all_cache(verbose: bool = False):
+def all_cache(verbose: bool = False, jobs: int = 1):
     if verbose:
         VERBOSE_LEVEL.set(20)
     repos()
-    venvs()
-    model_cache()
+    venvs(jobs=jobs)
+    model_cache(jobs=jobs)
     configs()
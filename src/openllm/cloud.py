@@ -1,3 +1,4 @@
+import functools
 import json
 import os
 import pathlib
@@ -32,30 +33,26 @@ def _get_deploy_cmd(bento: BentoInfo, target: typing.Optional[DeploymentTarget]
             f'This model requires the following environment variables to run: {required_env_names!r}', style='yellow'
         )
 
-    for env_info in bento.bento_yaml.get('envs', []):
+    for env_info in required_envs:
         if 'name' not in env_info:
             continue
-        if os.environ.get(env_info['name']):
-            default = os.environ[env_info['name']]
-        elif 'value' in env_info:
-            default = env_info['value']
-        else:
-            default = ''
+        name = env_info['name']
+        default = os.environ.get(name) or env_info.get('value', '')
 
         if INTERACTIVE.get():
             import questionary
 
-            value = questionary.text(f"{env_info['name']}:", default=default).ask()
+            value = questionary.text(f'{name}:', default=default).ask()
         else:
             if default == '':
-                output(f"Environment variable {env_info['name']} is required but not provided", style='red')
+                output(f'Environment variable {name} is required but not provided', style='red')
                 raise typer.Exit(1)
             else:
                 value = default
 
         if value is None:
             raise typer.Exit(1)
-        cmd += ['--env', f"{env_info['name']}={value}"]
+        cmd += ['--env', f'{name}={value}']
 
     if target:
         cmd += ['--instance-type', target.name]
@@ -68,6 +65,7 @@ def _get_deploy_cmd(bento: BentoInfo, target: typing.Optional[DeploymentTarget]
     return cmd, env, None
 
 
+@functools.lru_cache
 def ensure_cloud_context():
     import questionary
 
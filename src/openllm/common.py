@@ -85,18 +85,21 @@ class Config(SimpleNamespace):
     repos: dict[str, str] = {'default': 'https://github.com/bentoml/openllm-models@main'}
     default_repo: str = 'default'
 
+    def __init__(self, **kwargs):
+        # copy the class level default, otherwise mutating `repos` on an instance would modify it for every Config
+        kwargs.setdefault('repos', dict(type(self).repos))
+        super().__init__(**kwargs)
+
     def tolist(self):
         return dict(repos=self.repos, default_repo=self.default_repo)
 
 
 def load_config() -> Config:
-    if CONFIG_FILE.exists():
-        try:
-            with open(CONFIG_FILE) as f:
-                return Config(**json.load(f))
-        except json.JSONDecodeError:
-            return Config()
-    return Config()
+    try:
+        with open(CONFIG_FILE) as f:
+            return Config(**json.load(f))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return Config()
 
 
 def save_config(config: Config) -> None:
@@ -129,6 +132,13 @@ class RepoInfo(SimpleNamespace):
             )
 
 
+@functools.lru_cache
+def _load_bento_yaml(bento_file: pathlib.Path, mtime_ns: int) -> dict:
+    import yaml
+
+    return yaml.safe_load(bento_file.read_text())
+
+
 class BentoInfo(SimpleNamespace):
     repo: RepoInfo
     path: pathlib.Path
@@ -141,6 +151,10 @@ class BentoInfo(SimpleNamespace):
             return f'{self.repo.name}/{self.tag}'
 
     def __hash__(self):
+        return self._hash
+
+    @functools.cached_property
+    def _hash(self) -> int:
         return md5(str(self.path))
 
     @property
@@ -171,14 +185,12 @@ class BentoInfo(SimpleNamespace):
 
     @functools.cached_property
     def bento_yaml(self) -> dict:
-        import yaml
-
         bento_file = self.path / 'bento.yaml'
-        return yaml.safe_load(bento_file.read_text())
+        return _load_bento_yaml(bento_file, bento_file.stat().st_mtime_ns)
 
     @functools.cached_property
     def platforms(self) -> list[str]:
-        return self.bento_yaml['labels'].get('platforms', 'linux').split(',')
+        return self.bento_yaml.get('labels', {}).get('platforms', 'linux').split(',')
 
     @functools.cached_property
     def pretty_yaml(self) -> dict:
@@ -346,6 +358,7 @@ async def async_run_command(cmd, cwd=None, env=None, copy_env=True, venv=None, s
 
     env = env or {}
     cmd = [str(c) for c in cmd]
+    bin_dir = 'Scripts' if os.name == 'nt' else 'bin'
 
     if not silent:
         output('\n')
@@ -359,7 +372,7 @@ async def async_run_command(cmd, cwd=None, env=None, copy_env=True, venv=None, s
         output(f"$ {' '.join(cmd)}", style='orange')
 
     if venv:
-        py = venv / 'bin' / 'python'
+        py = venv / bin_dir / f"python{sysconfig.get_config_var('EXE')}"
     else:
         py = sys.executable
 
@@ -390,4 +403,4 @@ def md5(*strings: str) -> int:
     m = hashlib.md5()
     for s in strings:
         m.update(s.encode())
-    return int(m.hexdigest(), 16)
+    return int.from_bytes(m.digest(), 'big')
@@ -1,34 +1,23 @@
 import asyncio
 import time
 
-import httpx
-
 from openllm.common import BentoInfo, async_run_command, output, run_command, stream_command_output
 from openllm.venv import ensure_venv
 
 
-def prep_env_vars(bento: BentoInfo):
-    import os
-
-    env_vars = bento.envs
-    for env_var in env_vars:
-        if 'value' not in env_var:
-            continue
-        key = env_var['name']
-        value = env_var['value']
-        os.environ[key] = value
+def prep_env_vars(bento: BentoInfo) -> dict[str, str]:
+    return {env_var['name']: env_var['value'] for env_var in bento.envs if 'value' in env_var}
 
 
 def _get_serve_cmd(bento: BentoInfo, port: int = 3000):
     cmd = ['bentoml', 'serve', bento.bentoml_tag]
     if port != 3000:
         cmd += ['--port', str(port)]
-    env = {'BENTOML_HOME': f'{bento.repo.path}/bentoml'}
+    env = {**prep_env_vars(bento), 'BENTOML_HOME': f'{bento.repo.path}/bentoml'}
     return cmd, env, None
 
 
 def serve(bento: BentoInfo, port: int = 3000):
-    prep_env_vars(bento)
     venv = ensure_venv(bento)
     cmd, env, cwd = _get_serve_cmd(bento, port=port)
     output(f'Access the Chat UI at http://localhost:{port}/chat (or with you IP)')
@@ -36,6 +25,8 @@ def serve(bento: BentoInfo, port: int = 3000):
 
 
 async def _run_model(bento: BentoInfo, port: int = 3000, timeout: int = 600):
+    import httpx
+
     venv = ensure_venv(bento)
     cmd, env, cwd = _get_serve_cmd(bento, port)
     async with async_run_command(cmd, env=env, cwd=cwd, venv=venv, silent=False) as server_proc:
@@ -43,27 +34,30 @@ async def _run_model(bento: BentoInfo, port: int = 3000, timeout: int = 600):
 
         stdout_streamer = None
         stderr_streamer = None
-        start_time = time.time()
+        start_time = time.monotonic()
 
         output('Model loading...', style='green')
-        for _ in range(timeout):
-            try:
-                resp = httpx.get(f'http://localhost:{port}/readyz', timeout=3)
-                if resp.status_code == 200:
-                    break
-            except httpx.RequestError:
-                if time.time() - start_time > 30:
-                    if not stdout_streamer:
-                        stdout_streamer = asyncio.create_task(stream_command_output(server_proc.stdout, style='gray'))
-                    if not stderr_streamer:
-                        stderr_streamer = asyncio.create_task(
-                            stream_command_output(server_proc.stderr, style='#BD2D0F')
-                        )
-                await asyncio.sleep(1)
-        else:
-            output('Model failed to load', style='red')
-            server_proc.terminate()
-            return
+        async with httpx.AsyncClient(timeout=3) as http_client:
+            for _ in range(timeout):
+                try:
+                    resp = await http_client.get(f'http://localhost:{port}/readyz')
+                    if resp.status_code == 200:
+                        break
+                except httpx.RequestError:
+                    if time.monotonic() - start_time > 30:
+                        if not stdout_streamer:
+                            stdout_streamer = asyncio.create_task(
+                                stream_command_output(server_proc.stdout, style='gray')
+                            )
+                        if not stderr_streamer:
+                            stderr_streamer = asyncio.create_task(
+                                stream_command_output(server_proc.stderr, style='#BD2D0F')
+                            )
+                    await asyncio.sleep(1)
+            else:
+                output('Model failed to load', style='red')
+                server_proc.terminate()
+                return
 
         if stdout_streamer:
             stdout_streamer.cancel()
@@ -83,9 +77,9 @@ async def _run_model(bento: BentoInfo, port: int = 3000, timeout: int = 600):
                 if message == '':
                     output('empty message, please enter something', style='yellow')
                     continue
-                messages.append(dict(role='user', content=message))
+                messages.append({'role': 'user', 'content': message})
                 output('assistant: ', end='', style='lightgreen')
-                assistant_message = ''
+                assistant_chunks: list[str] = []
                 stream = await client.chat.completions.create(
                     model=model_id,
                     messages=messages,  # type: ignore
@@ -93,9 +87,9 @@ async def _run_model(bento: BentoInfo, port: int = 3000, timeout: int = 600):
                 )
                 async for chunk in stream:
                     text = chunk.choices[0].delta.content or ''
-                    assistant_message += text
+                    assistant_chunks.append(text)
                     output(text, end='', style='lightgreen')
-                messages.append(dict(role='assistant', content=assistant_message))
+                messages.append({'role': 'assistant', 'content': ''.join(assistant_chunks)})
                 output('')
             except KeyboardInterrupt:
                 break
@@ -104,5 +98,4 @@ async def _run_model(bento: BentoInfo, port: int = 3000, timeout: int = 600):
 
 
 def run(bento: BentoInfo, port: int = 3000, timeout: int = 600):
-    prep_env_vars(bento)
     asyncio.run(_run_model(bento, port=port, timeout=timeout))
@@ -2,7 +2,6 @@ import re
 import typing
 from typing import Optional
 
-import tabulate
 import typer
 
 from openllm.accelerator_spec import DeploymentTarget, can_run
@@ -24,6 +23,8 @@ def get(tag: str, repo: Optional[str] = None, verbose: bool = False):
 
 @app.command(name='list', help='list available models')
 def list_model(tag: Optional[str] = None, repo: Optional[str] = None, verbose: bool = False):
+    from tabulate import tabulate
+
     if verbose:
         VERBOSE_LEVEL.set(20)
 
@@ -38,7 +39,7 @@ def list_model(tag: Optional[str] = None, repo: Optional[str] = None, verbose: b
         seen.add(value)
         return False
 
-    table = tabulate.tabulate(
+    table = tabulate(
         [
             [
                 '' if is_seen(bento.name) else bento.name,
@@ -95,8 +96,8 @@ def list_bento(
     if repo_name is None and tag and '/' in tag:
         repo_name, tag = tag.split('/', 1)
 
+    config = load_config()
     if repo_name is not None:
-        config = load_config()
         if repo_name not in config.repos:
             output(f'Repo `{repo_name}` not found, did you mean one of these?')
             for repo_name in config.repos:
@@ -112,7 +113,6 @@ def list_bento(
         glob_pattern = f'bentoml/bentos/{tag}/*'
 
     model_list = []
-    config = load_config()
     for _repo_name, repo_url in config.repos.items():
         if repo_name is not None and _repo_name != repo_name:
             continue
@@ -137,12 +137,11 @@ def list_bento(
 
     if not include_alias:
         seen = set()
-        model_list = [
-            x
-            for x in model_list
-            if not (
-                f"{x.bento_yaml['name']}:{x.bento_yaml['version']}" in seen
-                or seen.add(f"{x.bento_yaml['name']}:{x.bento_yaml['version']}")
-            )
-        ]
+        unique_models = []
+        for x in model_list:
+            key = (x.bento_yaml['name'], x.bento_yaml['version'])
+            if key not in seen:
+                seen.add(key)
+                unique_models.append(x)
+        model_list = unique_models
     return model_list
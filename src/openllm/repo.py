@@ -1,10 +1,9 @@
 import datetime
+import functools
 import re
 import shutil
 import typing
 
-import pyaml
-import questionary
 import typer
 
 from openllm.analytic import OpenLLMTyper
@@ -17,6 +16,8 @@ app = OpenLLMTyper(help='manage repos')
 
 @app.command(name='list', help='list available repo')
 def list_repo(verbose: bool = False):
+    import pyaml
+
     if verbose:
         VERBOSE_LEVEL.set(20)
     config = load_config()
@@ -93,6 +94,8 @@ def update():
 
 
 def ensure_repo_updated():
+    import questionary
+
     last_update_file = REPO_DIR / 'last_update'
     if not last_update_file.exists():
         if INTERACTIVE.get():
@@ -131,6 +134,7 @@ GIT_SSH_RE = re.compile(
 )
 
 
+@functools.lru_cache
 def parse_repo_url(repo_url: str, repo_name: typing.Optional[str] = None) -> RepoInfo:
     """
     parse the git repo url to server, owner, repo name, branch
@@ -184,6 +188,8 @@ def parse_repo_url(repo_url: str, repo_name: typing.Optional[str] = None) -> Rep
 
 @app.command(help='add new repo')
 def add(name: str, repo: str):
+    import questionary
+
     name = name.lower()
     if not name.isidentifier():
         output(f'Invalid repo name: {name}, should only contain letters, numbers and underscores', style='red')